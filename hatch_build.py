@@ -0,0 +1,25 @@
+"""Hatchling build hook that byte-compiles the package tree.
+
+Runs compileall over pytabular/ at build time so local/editable installs
+start with a warm __pycache__ and syntax errors fail the build instead
+of the first `import pytabular`. Wheels installed through pip/uv still
+get their .pyc files from the installer's own compileall pass.
+"""
+
+import compileall
+import os
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CompileBytecodeHook(BuildHookInterface):
+    """Byte-compiles pytabular/ before the build target is assembled."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        """Compile the package tree in parallel (workers=0 uses all cores)."""
+        package_dir = os.path.join(self.root, "pytabular")
+        # compile_dir reports failure via a falsy return, not an exception
+        if not compileall.compile_dir(package_dir, quiet=1, workers=0):
+            raise RuntimeError(f"Byte-compiling {package_dir} failed")
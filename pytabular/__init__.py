@@ -6,107 +6,279 @@ Then it will begin to import specifics of the module.
 """
 
 # flake8: noqa
+import hashlib
+import importlib
+import json
 import logging
 import os
 import sys
 import platform
+import threading
 from rich.logging import RichHandler
 from rich.theme import Theme
 from rich.console import Console
 from rich import pretty
 
-pretty.install()
 console = Console(theme=Theme({"logging.level.warning": "bold reverse red"}))
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(message)s",
-    datefmt="[%H:%M:%S]",
-    handlers=[RichHandler(console=console)],
-)
 logger = logging.getLogger("PyTabular")
 logger.setLevel(logging.INFO)
-logger.info("Logging configured...")
-logger.info("To update logging:")
-logger.info(">>> import logging")
-logger.info(">>> pytabular.logger.setLevel(level=logging.INFO)")
-logger.info("See https://docs.python.org/3/library/logging.html#logging-levels")
 
+# Skip handler setup when logging is already configured (Jupyter kernel
+# restarts, pythonnet-hosted interpreters, repeated imports), so Rich
+# handlers do not stack up and the banner is not re-emitted.
+if not logging.getLogger().handlers:
+    if os.environ.get("PYTABULAR_RICH", "1") != "0":
+        # Patches sys.displayhook; set PYTABULAR_RICH=0 to skip in scripts.
+        pretty.install()
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(message)s",
+        datefmt="[%H:%M:%S]",
+        handlers=[RichHandler(console=console)],
+    )
+    logger.info("Logging configured...")
+    logger.info("To update logging:")
+    logger.info(">>> import logging")
+    logger.info(">>> pytabular.logger.setLevel(level=logging.INFO)")
+    logger.info("See https://docs.python.org/3/library/logging.html#logging-levels")
 
-logger.info(f"Python Version::{sys.version}")
-logger.info(f"Python Location::{sys.exec_prefix}")
-logger.info(f"Package Location:: {__file__}")
-logger.info(f"Working Directory:: {os.getcwd()}")
-logger.info(f"Platform:: {sys.platform}-{platform.release()}")
+    logger.info("Python Version::%s", sys.version)
+    logger.info("Python Location::%s", sys.exec_prefix)
+    logger.info("Package Location:: %s", __file__)
+    logger.info("Working Directory:: %s", os.getcwd())
+    logger.info("Platform:: %s-%s", sys.platform, platform.release())
 
 dll = os.path.join(os.path.dirname(__file__), "dll")
 sys.path.append(dll)
 sys.path.append(os.path.dirname(__file__))
 
-logger.info("Configuring pythonnet for cross-platform .NET...")
+logger.info("Deferring pythonnet/CLR setup until first .NET use...")
 
-# Try to configure pythonnet for coreclr before any CLR operations
 clr_imported = False
-try:
-    import pythonnet
-    from pythonnet import set_runtime
-    
-    # Try to configure runtime first
+_clr_lock = threading.Lock()
+
+# The DLLs fed to clr.AddReference, in dependency order.
+_REQUIRED_DLLS = (
+    "Microsoft.AnalysisServices.Runtime.Core.dll",
+    "Microsoft.AnalysisServices.Core.dll",
+    "Microsoft.AnalysisServices.dll",
+    "Microsoft.AnalysisServices.Tabular.dll",
+    "Microsoft.AnalysisServices.AdomdClient.dll",
+)
+
+
+def _dll_manifest_file() -> str:
+    """File path of the cached DLL manifest (honors `XDG_CACHE_HOME`)."""
+    cache_root = os.environ.get(
+        "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(cache_root, "pytabular", "dll_manifest.json")
+
+
+def _dll_manifest_key(dll_paths) -> str:
+    """Digest over `(path, size, mtime_ns)` of each required DLL."""
+    digest = hashlib.blake2b(digest_size=16)
+    for dll_path in dll_paths:
+        stat = os.stat(dll_path)
+        digest.update(f"{dll_path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _validate_dll_paths(dll_paths, manifest_key) -> None:
+    """Checks each required DLL exists and rewrites the manifest.
+
+    Only runs on cold starts or when the dll directory changed on disk.
+    Warm starts match the cached manifest and skip straight to
+    `clr.AddReference` with the pre-validated paths.
+    """
+    for dll_path in dll_paths:
+        if not os.path.isfile(dll_path):
+            raise FileNotFoundError(
+                f"Required DLL missing: {dll_path}. "
+                "Run script/update_adomo_linux.py to reinstall the DLLs."
+            )
+        logger.info("Validated %s", os.path.basename(dll_path))
+    if manifest_key is None:
+        return
+    manifest_file = _dll_manifest_file()
     try:
-        set_runtime("coreclr")
-        logger.info("✅ pythonnet configured for coreclr (.NET 8.0)")
-    except Exception as runtime_error:
-        if "already been loaded" in str(runtime_error):
-            logger.info("✅ .NET runtime already configured in this process")
+        os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+        with open(manifest_file, "w") as file:
+            json.dump({"key": manifest_key}, file)
+    except OSError as e:  # Cache is best-effort, never fail the import.
+        logger.debug("Could not write DLL manifest: %s", e)
+
+
+def _preimport() -> None:
+    """Pre-imports the heavyweight submodules on a background thread."""
+    for module_name in (".pytabular", ".query", ".best_practice_analyzer"):
+        try:
+            importlib.import_module(module_name, __name__)
+        except Exception as e:
+            logger.debug("Background pre-import of %s failed: %s", module_name, e)
+
+
+def _ensure_clr() -> None:
+    """Configures pythonnet for coreclr and adds the AMO/TOM references.
+
+    Runs once per process, on the first touch of a .NET-backed module.
+    `import pytabular` itself does no CLR work, so scripts that never
+    reach the .NET side skip the multi-second assembly load entirely.
+    """
+    global clr_imported
+    if clr_imported:
+        return
+    with _clr_lock:
+        if clr_imported:
+            return
+
+        logger.info("Configuring pythonnet for cross-platform .NET...")
+
+        # Try to configure pythonnet for coreclr before any CLR operations
+        try:
+            import pythonnet
+            from pythonnet import set_runtime
+
+            # Try to configure runtime first
+            try:
+                set_runtime("coreclr")
+                logger.info("✅ pythonnet configured for coreclr (.NET 8.0)")
+            except Exception as runtime_error:
+                if "already been loaded" in str(runtime_error):
+                    logger.info("✅ .NET runtime already configured in this process")
+                else:
+                    logger.warning(f"⚠️  Runtime configuration failed: {runtime_error}")
+
+            # Now import CLR
+            import clr
+
+            logger.info("✅ CLR imported successfully")
+
+        except Exception as e:
+            logger.error(f"❌ Failed to import pythonnet/CLR: {e}")
+            raise
+
+        logger.info("Beginning CLR references...")
+
+        logger.info("Adding DLL references for cross-platform .NET 8.0...")
+
+        dll_dir = os.path.join(os.path.dirname(__file__), "dll")
+        dll_paths = [os.path.join(dll_dir, name) for name in _REQUIRED_DLLS]
+
+        try:
+            with open(_dll_manifest_file()) as file:
+                cached_key = json.load(file).get("key")
+        except (OSError, ValueError):
+            cached_key = None
+
+        try:
+            manifest_key = _dll_manifest_key(dll_paths)
+        except OSError:
+            manifest_key = None
+
+        if manifest_key is not None and manifest_key == cached_key:
+            logger.debug("DLL manifest matches disk, skipping validation...")
         else:
-            logger.warning(f"⚠️  Runtime configuration failed: {runtime_error}")
-    
-    # Now import CLR
-    import clr
-    clr_imported = True
-    logger.info("✅ CLR imported successfully")
-    
-except Exception as e:
-    logger.error(f"❌ Failed to import pythonnet/CLR: {e}")
-    raise
+            _validate_dll_paths(dll_paths, manifest_key)
 
-logger.info("Beginning CLR references...")
+        # Register one resolver spanning all shipped assemblies, so
+        # cross-assembly references (e.g. Tabular pulling Core) resolve
+        # from an in-memory map instead of the loader re-probing the dll
+        # directory for each missing name.
+        try:
+            import System
+            from System.Reflection import Assembly
 
-logger.info("Adding DLL references for cross-platform .NET 8.0...")
+            assembly_paths = {
+                name[:-4]: os.path.join(dll_dir, name) for name in _REQUIRED_DLLS
+            }
+            loaded_assemblies = {}
 
-# Load DLLs in dependency order
-dll_dir = os.path.join(os.path.dirname(__file__), "dll")
+            def _resolve_assembly(sender, args):
+                assembly_name = args.Name.split(",", 1)[0]
+                dll_path = assembly_paths.get(assembly_name)
+                if dll_path is None:
+                    return None
+                if assembly_name not in loaded_assemblies:
+                    loaded_assemblies[assembly_name] = Assembly.LoadFrom(dll_path)
+                return loaded_assemblies[assembly_name]
 
-logger.info("Adding Reference Microsoft.AnalysisServices.Runtime.Core")
-clr.AddReference(os.path.join(dll_dir, "Microsoft.AnalysisServices.Runtime.Core.dll"))
+            System.AppDomain.CurrentDomain.AssemblyResolve += _resolve_assembly
+        except Exception as e:  # Resolver is an optimization, never fatal.
+            logger.debug("Could not register assembly resolver: %s", e)
 
-logger.info("Adding Reference Microsoft.AnalysisServices.Core")
-clr.AddReference(os.path.join(dll_dir, "Microsoft.AnalysisServices.Core.dll"))
+        # Feed the pre-validated paths to pythonnet in dependency order.
+        for dll_path in dll_paths:
+            logger.info("Adding Reference %s", os.path.basename(dll_path)[:-4])
+            clr.AddReference(dll_path)
 
-logger.info("Adding Reference Microsoft.AnalysisServices")
-clr.AddReference(os.path.join(dll_dir, "Microsoft.AnalysisServices.dll"))
+        logger.info("✅ All cross-platform DLLs loaded successfully")
 
-logger.info("Adding Reference Microsoft.AnalysisServices.Tabular")
-clr.AddReference(os.path.join(dll_dir, "Microsoft.AnalysisServices.Tabular.dll"))
+        clr_imported = True
 
-logger.info("Adding Reference Microsoft.AnalysisServices.AdomdClient")
-clr.AddReference(os.path.join(dll_dir, "Microsoft.AnalysisServices.AdomdClient.dll"))
+    # Overlap the .py compile + pandas import of the heavy submodules with
+    # the CLR's assembly metadata loading. importlib holds an internal
+    # per-module lock, so a caller importing one of these simply waits on
+    # this thread instead of duplicating the work.
+    if not os.environ.get("PYTABULAR_NO_PRELOAD"):
+        threading.Thread(
+            target=_preimport, name="pytabular-preimport", daemon=True
+        ).start()
 
-logger.info("✅ All cross-platform DLLs loaded successfully")
+logger.info("Deferring submodule imports until first use...")
 
-logger.info("Importing specifics in module...")
-from .pytabular import Tabular
+__all__ = [
+    "Tabular",
+    "BaseTrace",
+    "RefreshTrace",
+    "QueryMonitor",
+    "TabularEditor",
+    "BPA",
+    "Connection",
+    "find_local_pbi_instances",
+    "ModelDocumenter",
+    "Tmdl",
+    "pd_dataframe_to_m_expression",
+    "pandas_datatype_to_tabular_datatype",
+]
 
-from .logic_utils import (
-    pd_dataframe_to_m_expression,
-    pandas_datatype_to_tabular_datatype,
-)
-from .tabular_tracing import BaseTrace, RefreshTrace, QueryMonitor
-from .tabular_editor import TabularEditor
-from .best_practice_analyzer import BPA
-from .query import Connection
-from .pbi_helper import find_local_pbi_instances
-from .document import ModelDocumenter
-from .tmdl import Tmdl
+# Public name -> (submodule, attribute) for the lazy imports below.
+# Submodules (and their pandas/.NET baggage) only load when first touched,
+# so `import pytabular` stays fast for callers that need just a slice of it.
+_LAZY_IMPORTS = {
+    "Tabular": ("pytabular", "Tabular"),
+    "BaseTrace": ("tabular_tracing", "BaseTrace"),
+    "RefreshTrace": ("tabular_tracing", "RefreshTrace"),
+    "QueryMonitor": ("tabular_tracing", "QueryMonitor"),
+    "TabularEditor": ("tabular_editor", "TabularEditor"),
+    "BPA": ("best_practice_analyzer", "BPA"),
+    "Connection": ("query", "Connection"),
+    "find_local_pbi_instances": ("pbi_helper", "find_local_pbi_instances"),
+    "ModelDocumenter": ("document", "ModelDocumenter"),
+    "Tmdl": ("tmdl", "Tmdl"),
+    "pd_dataframe_to_m_expression": ("logic_utils", "pd_dataframe_to_m_expression"),
+    "pandas_datatype_to_tabular_datatype": (
+        "logic_utils",
+        "pandas_datatype_to_tabular_datatype",
+    ),
+}
+
+
+def __getattr__(name):
+    """PEP 562 hook. Imports the submodule backing `name` on first access."""
+    try:
+        module_name, attribute = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    logger.debug("Lazy loading %s for %s...", module_name, name)
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, attribute)
+    globals()[name] = value  # Cache so __getattr__ only fires once per name.
+    return value
 
 
-logger.info("Import successful...")
+def __dir__():
+    """Includes the lazily imported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
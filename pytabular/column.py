@@ -6,7 +6,13 @@ Once connected to your model, interacting with column(s) will be done through th
 import logging
 import pandas as pd
 from pytabular.object import PyObject, PyObjects
-from Microsoft.AnalysisServices.Tabular import ColumnType
+
+# Configure the CLR before touching .NET assemblies (no-op once loaded).
+from pytabular import _ensure_clr
+
+_ensure_clr()
+
+from Microsoft.AnalysisServices.Tabular import ColumnType  # noqa: E402
 
 logger = logging.getLogger("PyTabular")
 
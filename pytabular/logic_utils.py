@@ -8,8 +8,13 @@ import pandas as pd
 
 from pytabular.currency import unicodes
 
-from Microsoft.AnalysisServices.Tabular import DataType
-from Microsoft.AnalysisServices.AdomdClient import AdomdDataReader
+# Configure the CLR before touching .NET assemblies (no-op once loaded).
+from pytabular import _ensure_clr
+
+_ensure_clr()
+
+from Microsoft.AnalysisServices.Tabular import DataType  # noqa: E402
+from Microsoft.AnalysisServices.AdomdClient import AdomdDataReader  # noqa: E402
 
 logger = logging.getLogger("PyTabular")
 
@@ -7,7 +7,13 @@ will be done through these classes.
 import logging
 import pandas as pd
 from pytabular.object import PyObject, PyObjects
-from Microsoft.AnalysisServices.Tabular import Measure, Table
+
+# Configure the CLR before touching .NET assemblies (no-op once loaded).
+from pytabular import _ensure_clr
+
+_ensure_clr()
+
+from Microsoft.AnalysisServices.Tabular import Measure, Table  # noqa: E402
 
 
 logger = logging.getLogger("PyTabular")
@@ -23,8 +23,15 @@ from typing import Union
 from pytabular.logic_utils import get_value_to_df
 import pandas as pd
 
-# Import .NET assemblies - CLR is configured in __init__.py before this module loads
-from Microsoft.AnalysisServices.AdomdClient import AdomdCommand, AdomdConnection
+# Configure the CLR before touching .NET assemblies (no-op once loaded).
+from pytabular import _ensure_clr
+
+_ensure_clr()
+
+from Microsoft.AnalysisServices.AdomdClient import (  # noqa: E402
+    AdomdCommand,
+    AdomdConnection,
+)
 
 logger = logging.getLogger("PyTabular")
 
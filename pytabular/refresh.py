@@ -30,17 +30,23 @@ Example:
 
 from tabular_tracing import RefreshTrace, BaseTrace
 import logging
-from Microsoft.AnalysisServices.Tabular import (
+
+# Configure the CLR before touching .NET assemblies (no-op once loaded).
+from pytabular import _ensure_clr
+
+_ensure_clr()
+
+from Microsoft.AnalysisServices.Tabular import (  # noqa: E402
     RefreshType,
     Table,
     Partition,
 )
-import pandas as pd
-from logic_utils import ticks_to_datetime
-from typing import Union, Dict, Any
-from pytabular.table import PyTable, PyTables
-from pytabular.partition import PyPartition
-from abc import ABC
+import pandas as pd  # noqa: E402
+from logic_utils import ticks_to_datetime  # noqa: E402
+from typing import Union, Dict, Any  # noqa: E402
+from pytabular.table import PyTable, PyTables  # noqa: E402
+from pytabular.partition import PyPartition  # noqa: E402
+from abc import ABC  # noqa: E402
 
 logger = logging.getLogger("PyTabular")
 
@@ -8,12 +8,17 @@ import logging
 from pytabular.object import PyObject, PyObjects
 from pytabular.table import PyTable, PyTables
 
-from Microsoft.AnalysisServices.Tabular import (
+# Configure the CLR before touching .NET assemblies (no-op once loaded).
+from pytabular import _ensure_clr
+
+_ensure_clr()
+
+from Microsoft.AnalysisServices.Tabular import (  # noqa: E402
     CrossFilteringBehavior,
     SecurityFilteringBehavior,
 )
 
-from typing import Union
+from typing import Union  # noqa: E402
 
 logger = logging.getLogger("PyTabular")
 
@@ -30,13 +30,23 @@ import logging
 import random
 import xmltodict
 from typing import List, Callable
-from Microsoft.AnalysisServices.Tabular import Trace, TraceEvent, TraceEventHandler
-from Microsoft.AnalysisServices import (
+
+# Configure the CLR before touching .NET assemblies (no-op once loaded).
+from pytabular import _ensure_clr
+
+_ensure_clr()
+
+from Microsoft.AnalysisServices.Tabular import (  # noqa: E402
+    Trace,
+    TraceEvent,
+    TraceEventHandler,
+)
+from Microsoft.AnalysisServices import (  # noqa: E402
     TraceColumn,
     TraceEventClass,
     TraceEventSubclass,
 )
-import atexit
+import atexit  # noqa: E402
 
 logger = logging.getLogger("PyTabular")
 
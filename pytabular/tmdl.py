@@ -4,7 +4,12 @@ Run `Tmdl(model).save_to_folder()` to save tmdl of model.
 Run `Tmdl(model).execute()` to execute a specific set of tmdl scripts.
 """
 
-from Microsoft.AnalysisServices.Tabular import TmdlSerializer
+# Configure the CLR before touching .NET assemblies (no-op once loaded).
+from pytabular import _ensure_clr
+
+_ensure_clr()
+
+from Microsoft.AnalysisServices.Tabular import TmdlSerializer  # noqa: E402
 
 
 class Tmdl:
@@ -13,8 +13,10 @@ Date: 2024
 """
 
 import argparse
+import functools
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import os
 import shutil
 import subprocess
@@ -23,10 +25,17 @@ import tempfile
 import zipfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from urllib.request import urlretrieve
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # SIMD-accelerated (SSE4/AVX2/AVX-512 paths) when the wheel is installed
+    from blake3 import blake3 as _dll_hash
+except ImportError:
+    from hashlib import blake2b as _dll_hash
 
 # Configure logging
 logging.basicConfig(
@@ -43,7 +52,6 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).parent.parent
 DLL_DIR = PROJECT_ROOT / "pytabular" / "dll"
 BACKUP_DIR = PROJECT_ROOT / "dll_backup"
-TEMP_DIR = Path(tempfile.mkdtemp())
 
 # NuGet package information - ONLY the DLLs that PyTabular actually needs and work cross-platform
 NUGET_PACKAGES = {
@@ -58,11 +66,83 @@ NUGET_PACKAGES = {
     }
 }
 
-# Collect ALL required DLLs (main + additional)
-REQUIRED_DLLS = set()
-for pkg in NUGET_PACKAGES.values():
-    REQUIRED_DLLS.add(pkg["dll_name"])
-    REQUIRED_DLLS.update(pkg.get("additional_dlls", []))
+# ALL required DLLs (main + additional), frozen for the set-difference
+# checks in verify_dll_directory and the per-entry extraction filter
+REQUIRED_DLLS: frozenset = frozenset({
+    "Microsoft.AnalysisServices.AdomdClient.dll",
+    "Microsoft.AnalysisServices.dll",
+    "Microsoft.AnalysisServices.Core.dll",
+    "Microsoft.AnalysisServices.Runtime.Core.dll",
+    "Microsoft.AnalysisServices.Tabular.dll",
+})
+
+# Keep the literal in sync with NUGET_PACKAGES (compiled out under -O)
+assert REQUIRED_DLLS == {
+    dll
+    for pkg in NUGET_PACKAGES.values()
+    for dll in (pkg["dll_name"], *pkg.get("additional_dlls", []))
+}, "REQUIRED_DLLS literal out of sync with NUGET_PACKAGES"
+
+# Cross-platform target frameworks in preference order - NO FALLBACK to .NET Framework
+CROSS_PLATFORM_FRAMEWORKS = ("net8.0", "net7.0", "net6.0", "netstandard2.0")
+
+
+def _file_digest(path: Path) -> bytes:
+    """Hash a file in 1 MiB chunks for change detection."""
+    hasher = _dll_hash()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.digest()
+
+
+def _fast_copy(src: Path, dst: Path) -> int:
+    """Copy src to dst and return the number of bytes copied.
+
+    Uses os.copy_file_range where available so the kernel moves the bytes
+    directly (reflink or server-side copy on filesystems that support it)
+    instead of shuttling buffers through userspace; falls back to
+    shutil.copyfile elsewhere. Metadata is carried over with one copystat
+    rather than copy2's per-file stat+chmod round trips.
+    """
+    size = os.path.getsize(src)
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = size
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), remaining
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return size
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return size
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_framework_dir(lib_dir: Path) -> Optional[str]:
+    """Resolve the preferred framework directory under lib/ (cached).
+
+    Every DLL in a package ships under the same target-framework folder,
+    so resolve it once per extract dir instead of re-statting all the
+    framework candidates for every DLL. Works on raw strings: one
+    os.path.isdir per candidate instead of Path allocations.
+    """
+    lib_str = os.fspath(lib_dir)
+    for target_framework in CROSS_PLATFORM_FRAMEWORKS:
+        framework_dir = os.path.join(lib_str, target_framework)
+        if os.path.isdir(framework_dir):
+            return framework_dir
+    return None
+
 
 class NuGetPackageManager:
     """Manages NuGet package downloads and extraction."""
@@ -70,33 +150,71 @@ class NuGetPackageManager:
     def __init__(self, temp_dir: Path):
         self.temp_dir = temp_dir
         self.nuget_api_base = "https://api.nuget.org/v3-flatcontainer"
-        self.nuget_search_api = "https://azuresearch-usnc.nuget.org/query"
-        
+        # Pooled session with Keep-Alive so version lookups and downloads
+        # reuse one TLS connection instead of handshaking per request
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.3),
+            ),
+        )
+        # Successful version lookups only; failures stay uncached so a
+        # retry after a transient network error re-hits the API
+        self._version_cache: Dict[str, str] = {}
+
     def get_latest_version(self, package_name: str) -> Optional[str]:
-        """Get the latest version of a NuGet package."""
-        logger.info(f"Fetching latest version for {package_name}")
-        
+        """Get the latest stable version of a NuGet package (memoized).
+
+        Reads the CDN-cached v3-flatcontainer index.json - the same host
+        the download hits next, so both ride one Keep-Alive connection
+        instead of a separate round trip to the search API.
+        """
+        cached_version = self._version_cache.get(package_name)
+        if cached_version is not None:
+            return cached_version
+
+        logger.info("Fetching latest version for %s", package_name)
+
         try:
-            response = requests.get(
-                f"{self.nuget_search_api}?q=packageid:{package_name}&take=1"
+            response = self.session.get(
+                f"{self.nuget_api_base}/{package_name.lower()}/index.json",
+                timeout=30
             )
             response.raise_for_status()
-            
-            data = response.json()
-            if data["data"]:
-                version = data["data"][0]["version"]
-                logger.info(f"Latest version for {package_name}: {version}")
+
+            versions = response.json().get("versions", [])
+            # Versions are sorted ascending; skip -preview/-rc prereleases
+            stable_versions = [v for v in versions if "-" not in v]
+            if stable_versions:
+                version = stable_versions[-1]
+                logger.info("Latest version for %s: %s", package_name, version)
+                self._version_cache[package_name] = version
                 return version
             else:
-                logger.error(f"No versions found for {package_name}")
+                logger.error("No stable versions found for %s", package_name)
                 return None
-                
+
         except requests.RequestException as e:
-            logger.error(f"Error fetching version for {package_name}: {e}")
+            logger.error("Error fetching version for %s: %s", package_name, e)
             return None
-    
 
-    
+    def resolve_and_download(
+        self, package_name: str, version: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[Path]]:
+        """Resolve the version (unless pinned) and download in one go.
+
+        The index lookup and the nupkg download go back to back over the
+        pooled connection to the flat-container host.
+        """
+        if not version:
+            version = self.get_latest_version(package_name)
+            if not version:
+                return None, None
+        return version, self.download_package(package_name, version)
+
     def download_package(self, package_name: str, version: str) -> Optional[Path]:
         """Download a NuGet package."""
         logger.info(f"Downloading {package_name} v{version}")
@@ -106,10 +224,15 @@ class NuGetPackageManager:
         
         try:
             package_file = self.temp_dir / f"{package_name}.{version}.nupkg"
-            
+
             logger.info(f"Downloading from: {package_url}")
-            urlretrieve(package_url, package_file)
-            
+            # Stream through the pooled session with a 1 MiB copy buffer,
+            # keeping the connection alive for the next request
+            with self.session.get(package_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                with open(package_file, "wb") as fh:
+                    shutil.copyfileobj(response.raw, fh, length=1 << 20)
+
             logger.info(f"Downloaded to: {package_file}")
             return package_file
             
@@ -118,46 +241,84 @@ class NuGetPackageManager:
             return None
     
     def extract_package(self, package_file: Path) -> Optional[Path]:
-        """Extract a NuGet package."""
+        """Extract only the required DLLs from a NuGet package.
+
+        A .nupkg also carries signatures, docs, XML and every TFM flavor -
+        typically 5-10x the bytes we actually need. Only entries whose
+        basename is in REQUIRED_DLLS get inflated, and only from the most
+        preferred cross-platform framework folder that ships them.
+        """
         logger.info(f"Extracting {package_file}")
-        
+
         try:
             extract_dir = self.temp_dir / package_file.stem
             extract_dir.mkdir(exist_ok=True)
-            
+
+            lib_prefixes = tuple(
+                f"lib/{framework}/" for framework in CROSS_PLATFORM_FRAMEWORKS
+            )
+
             with zipfile.ZipFile(package_file, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            logger.info(f"Extracted to: {extract_dir}")
+                # Keep one entry per DLL: the highest-preference framework
+                best_entries = {}
+                for info in zip_ref.infolist():
+                    for rank, lib_prefix in enumerate(lib_prefixes):
+                        if info.filename.startswith(lib_prefix):
+                            dll_name = info.filename.rsplit("/", 1)[-1]
+                            if dll_name in REQUIRED_DLLS and rank < best_entries.get(
+                                dll_name, (len(lib_prefixes),)
+                            )[0]:
+                                best_entries[dll_name] = (rank, info)
+                            break
+
+                for _, info in best_entries.values():
+                    zip_ref.extract(info, extract_dir)
+
+            logger.info(
+                f"Extracted {len(best_entries)} required DLL(s) to: {extract_dir}"
+            )
             return extract_dir
-            
+
         except Exception as e:
             logger.error(f"Error extracting {package_file}: {e}")
             return None
     
     def find_specific_dll(self, extract_dir: Path, dll_name: str) -> Optional[Path]:
         """Find a specific DLL in the extracted package - CROSS-PLATFORM ONLY."""
-        logger.info(f"Searching for {dll_name} in {extract_dir}")
+        logger.info("Searching for %s in %s", dll_name, extract_dir)
         
         lib_dir = extract_dir / "lib"
-        
+
         if not lib_dir.exists():
             logger.warning(f"No lib directory found in {extract_dir}")
             return None
-        
-        # ONLY look for .NET 6.0+ libraries (cross-platform) - NO FALLBACK to .NET Framework
-        cross_platform_frameworks = ["net8.0", "net7.0", "net6.0", "netstandard2.0"]
-        
-        for target_framework in cross_platform_frameworks:
-            framework_dir = lib_dir / target_framework
-            if framework_dir.exists():
-                dll_file = framework_dir / dll_name
-                if dll_file.exists():
-                    logger.info(f"✅ Found {dll_name} in {target_framework}: {dll_file}")
-                    return dll_file
-                else:
-                    logger.debug(f"DLL {dll_name} not found in {framework_dir}")
-        
+
+        framework_dir = _resolve_framework_dir(lib_dir)
+        if framework_dir is not None:
+            dll_file = os.path.join(framework_dir, dll_name)
+            if os.path.isfile(dll_file):
+                logger.info(
+                    "✅ Found %s in %s: %s",
+                    dll_name,
+                    os.path.basename(framework_dir),
+                    dll_file,
+                )
+                return Path(dll_file)
+            else:
+                logger.debug("DLL %s not found in %s", dll_name, framework_dir)
+
+        # Mixed-TFM packages can ship DLLs under different framework
+        # folders (extract_package keeps the best entry per DLL), so scan
+        # the remaining candidates before giving up
+        lib_str = os.fspath(lib_dir)
+        for target_framework in CROSS_PLATFORM_FRAMEWORKS:
+            candidate = os.path.join(lib_str, target_framework, dll_name)
+            if os.path.isfile(candidate):
+                logger.info(
+                    "✅ Found %s in %s: %s", dll_name, target_framework, candidate
+                )
+                return Path(candidate)
+
         # Check what's actually available
         available_dirs = [d.name for d in lib_dir.iterdir() if d.is_dir()]
         logger.warning(f"❌ {dll_name} not found in cross-platform frameworks")
@@ -171,7 +332,14 @@ class AdomoUpdater:
     
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
-        self.package_manager = NuGetPackageManager(TEMP_DIR)
+        # RAM-backed temp dir on Linux (/dev/shm) so nupkg extraction never
+        # hits disk; falls back to the platform default elsewhere
+        self._temp_ctx = tempfile.TemporaryDirectory(
+            dir="/dev/shm" if os.path.isdir("/dev/shm") else None,
+            prefix="pytabular-nuget-",
+        )
+        self.temp_dir = Path(self._temp_ctx.name)
+        self.package_manager = NuGetPackageManager(self.temp_dir)
         self.updated_packages = {}
         
     def backup_existing_dlls(self):
@@ -187,68 +355,107 @@ class AdomoUpdater:
             return
         
         BACKUP_DIR.mkdir(exist_ok=True)
-        
-        for dll_file in DLL_DIR.glob("*.dll"):
-            backup_file = BACKUP_DIR / dll_file.name
-            shutil.copy2(dll_file, backup_file)
-            logger.info(f"Backed up: {dll_file} -> {backup_file}")
+
+        with os.scandir(DLL_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".dll"):
+                    continue
+                backup_file = BACKUP_DIR / entry.name
+                # Hardlink the backup: O(1) metadata instead of copying
+                # ~100 MB. The backup's inode reference survives when the
+                # primary name is later unlinked or replaced.
+                try:
+                    backup_file.unlink(missing_ok=True)
+                    os.link(entry.path, backup_file)
+                except OSError:
+                    # Cross-device backup dir or filesystem without links
+                    shutil.copy2(entry.path, backup_file)
+                logger.info("Backed up: %s -> %s", entry.path, backup_file)
     
 
     
 
     
+    def _download_and_extract(
+        self, package_name: str, version: Optional[str]
+    ) -> Optional[Dict]:
+        """Resolve, download, and extract one package (on a worker thread)."""
+        pkg_version, package_file = self.package_manager.resolve_and_download(
+            package_name, version
+        )
+        if not pkg_version:
+            logger.error(f"Could not determine version for {package_name}")
+            return None
+        if not package_file:
+            logger.error(f"Failed to download {package_name}")
+            return None
+
+        extract_dir = self.package_manager.extract_package(package_file)
+        if not extract_dir:
+            logger.error(f"Failed to extract {package_name}")
+            return None
+
+        logger.info(f"✅ Downloaded and extracted {package_name} v{pkg_version}")
+        return {
+            'version': pkg_version,
+            'extract_dir': extract_dir,
+            'dll_name': NUGET_PACKAGES[package_name]["dll_name"],
+            'additional_dlls': NUGET_PACKAGES[package_name].get("additional_dlls", [])
+        }
+
     def update_all_packages(self, version: Optional[str] = None) -> bool:
         """Update all ADOMO packages with optimized workflow: download → delete → replace."""
         logger.info("Starting ADOMO package update...")
-        logger.info(f"Will update ALL {len(REQUIRED_DLLS)} required DLLs: {', '.join(sorted(REQUIRED_DLLS))}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Will update ALL %d required DLLs: %s",
+                len(REQUIRED_DLLS),
+                ', '.join(sorted(REQUIRED_DLLS)),
+            )
         
         # PHASE 1: Download all packages first
         logger.info("📥 PHASE 1: Downloading all packages...")
         downloaded_packages = {}
-        
-        for package_name in NUGET_PACKAGES:
-            # Get latest version if not specified
-            pkg_version = version
-            if not pkg_version:
-                pkg_version = self.package_manager.get_latest_version(package_name)
-                if not pkg_version:
-                    logger.error(f"Could not determine version for {package_name}")
-                    return False
-            
-            # Download package
-            package_file = self.package_manager.download_package(package_name, pkg_version)
-            if not package_file:
-                logger.error(f"Failed to download {package_name}")
-                return False
-            
-            # Extract package
-            extract_dir = self.package_manager.extract_package(package_file)
-            if not extract_dir:
-                logger.error(f"Failed to extract {package_name}")
-                return False
-            
-            downloaded_packages[package_name] = {
-                'version': pkg_version,
-                'extract_dir': extract_dir,
-                'dll_name': NUGET_PACKAGES[package_name]["dll_name"],
-                'additional_dlls': NUGET_PACKAGES[package_name].get("additional_dlls", [])
+
+        # Each step is pure network/IO, so resolve+download+extract every
+        # package concurrently; results are collected back in the
+        # original package ordering
+        with ThreadPoolExecutor(max_workers=len(NUGET_PACKAGES) * 2) as executor:
+            futures = {
+                package_name: executor.submit(
+                    self._download_and_extract, package_name, version
+                )
+                for package_name in NUGET_PACKAGES
             }
-            
-            logger.info(f"✅ Downloaded and extracted {package_name} v{pkg_version}")
-        
+
+            for package_name in NUGET_PACKAGES:
+                package_info = futures[package_name].result()
+                if not package_info:
+                    return False
+                downloaded_packages[package_name] = package_info
+
         # PHASE 2: Backup existing DLLs
         logger.info("💾 PHASE 2: Backing up existing DLLs...")
         self.backup_existing_dlls()
         
-        # PHASE 3: Delete old DLLs (clear the directory)
-        logger.info("🗑️ PHASE 3: Removing old DLLs...")
+        # PHASE 3: Delete stale DLLs. Required DLLs stay in place so Phase 4
+        # can hash-compare them and skip byte-identical replacements
+        logger.info("🗑️ PHASE 3: Removing stale DLLs...")
         if DLL_DIR.exists():
-            for dll_file in DLL_DIR.glob("*.dll"):
+            # One scandir pass; DirEntry paths feed os.unlink directly
+            with os.scandir(DLL_DIR) as entries:
+                stale_dlls = [
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(".dll")
+                    and entry.name not in REQUIRED_DLLS
+                ]
+            for entry in stale_dlls:
                 if self.dry_run:
-                    logger.info(f"[DRY RUN] Would remove: {dll_file}")
+                    logger.info("[DRY RUN] Would remove: %s", entry.path)
                 else:
-                    logger.info(f"Removing old DLL: {dll_file}")
-                    dll_file.unlink()
+                    logger.info("Removing old DLL: %s", entry.path)
+                    os.unlink(entry.path)
         
         # PHASE 4: Copy new DLLs
         logger.info("📦 PHASE 4: Installing new DLLs...")
@@ -259,7 +466,7 @@ class AdomoUpdater:
             copied_dlls = []
             total_size = 0
             
-            logger.info(f"Installing {len(all_dlls)} DLL(s) from {package_name}...")
+            logger.info("Installing %d DLL(s) from %s...", len(all_dlls), package_name)
             
             for dll_name in all_dlls:
                 dll_file = self.package_manager.find_specific_dll(extract_dir, dll_name)
@@ -271,16 +478,29 @@ class AdomoUpdater:
                 target_file = DLL_DIR / dll_file.name
                 
                 if self.dry_run:
-                    logger.info(f"[DRY RUN] Would install: {dll_file} -> {target_file}")
+                    logger.info(
+                        "[DRY RUN] Would install: %s -> %s", dll_file, target_file
+                    )
+                    copied_dlls.append(dll_name)
+                    total_size += os.path.getsize(dll_file)
+                elif (
+                    target_file.exists()
+                    and _file_digest(dll_file) == _file_digest(target_file)
+                ):
+                    # NuGet shipped a byte-identical file; keep the existing one
+                    logger.info("⏭️ Unchanged, skipping: %s", dll_name)
                     copied_dlls.append(dll_name)
-                    total_size += dll_file.stat().st_size
+                    total_size += os.path.getsize(dll_file)
                 else:
                     try:
                         DLL_DIR.mkdir(exist_ok=True)
-                        shutil.copy2(dll_file, target_file)
-                        logger.info(f"✅ Installed: {dll_name} -> {target_file}")
+                        # Unlink before writing so a hardlinked backup keeps
+                        # the old inode instead of being truncated with it
+                        target_file.unlink(missing_ok=True)
+                        # _fast_copy reports bytes copied, no post-hoc stat
+                        total_size += _fast_copy(dll_file, target_file)
+                        logger.info("✅ Installed: %s -> %s", dll_name, target_file)
                         copied_dlls.append(dll_name)
-                        total_size += dll_file.stat().st_size
                     except Exception as e:
                         logger.error(f"Error installing {dll_file}: {e}")
                         return False
@@ -304,8 +524,15 @@ class AdomoUpdater:
             logger.error("DLL directory does not exist")
             return False
         
-        current_dlls = {f.name for f in DLL_DIR.glob("*.dll")}
-        
+        # Single scandir pass; DirEntry avoids the extra stat glob incurs
+        with os.scandir(DLL_DIR) as entries:
+            current_dlls = {
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".dll")
+                and entry.is_file(follow_symlinks=False)
+            }
+
         # Check if we have exactly the required DLLs
         missing_dlls = REQUIRED_DLLS - current_dlls
         extra_dlls = current_dlls - REQUIRED_DLLS
@@ -364,33 +591,40 @@ class AdomoUpdater:
     def cleanup(self):
         """Clean up temporary files."""
         logger.info("Cleaning up temporary files...")
+        self.package_manager.session.close()
         try:
-            shutil.rmtree(TEMP_DIR)
+            self._temp_ctx.cleanup()
         except Exception as e:
             logger.warning(f"Error cleaning up temp directory: {e}")
 
-def check_prerequisites():
+def check_prerequisites(session: requests.Session) -> bool:
     """Check if prerequisites are met."""
     logger.info("Checking prerequisites...")
-    
+
     # Check if we're in the right directory
     if not PROJECT_ROOT.exists():
         logger.error("Project root not found. Run this script from the project root.")
         return False
-    
+
     # Check if pytabular directory exists
     if not (PROJECT_ROOT / "pytabular").exists():
         logger.error("pytabular directory not found.")
         return False
-    
-    # Check internet connection
+
+    # Check internet connection with a cheap HEAD probe (no response body);
+    # this also warms the pooled Keep-Alive connection for the downloads.
+    # Any HTTP response at all proves reachability
     try:
-        requests.get("https://api.nuget.org", timeout=10)
+        session.head(
+            "https://api.nuget.org/v3/index.json",
+            timeout=3,
+            allow_redirects=True,
+        )
         logger.info("Internet connection: OK")
     except requests.RequestException:
         logger.error("No internet connection. Cannot download packages.")
         return False
-    
+
     return True
 
 def main():
@@ -426,13 +660,15 @@ def main():
     if args.dry_run:
         logger.info("DRY RUN MODE - No files will be modified")
     
+    # Create updater first so the prerequisite probe reuses (and warms)
+    # its pooled session
+    updater = AdomoUpdater(dry_run=args.dry_run)
+
     # Check prerequisites
-    if not check_prerequisites():
+    if not check_prerequisites(updater.package_manager.session):
+        updater.cleanup()
         sys.exit(1)
-    
-    # Create updater and run update
-    updater = AdomoUpdater(dry_run=args.dry_run)
-    
+
     try:
         # Verify current state
         logger.info("Verifying current DLL directory state...")
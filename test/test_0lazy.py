@@ -0,0 +1,36 @@
+"""pytest for the lazy `import pytabular` namespace in `__init__.py`.
+
+These assertions run in a subprocess, because by the time the rest of
+the suite executes in this process the submodules (and the CLR) have
+already been loaded.
+"""
+
+import subprocess
+import sys
+
+_LAZY_IMPORT_CHECK = """
+import sys
+import pytabular
+
+assert pytabular.clr_imported is False, "import pytabular configured the CLR"
+
+lazy_submodules = {
+    f"pytabular.{module}" for module, _ in pytabular._LAZY_IMPORTS.values()
+}
+eagerly_loaded = lazy_submodules & set(sys.modules)
+assert not eagerly_loaded, f"submodules imported eagerly: {eagerly_loaded}"
+
+assert set(pytabular.__all__) <= set(dir(pytabular))
+
+try:
+    pytabular.not_a_real_attribute
+except AttributeError:
+    pass
+else:
+    raise AssertionError("unknown attribute did not raise AttributeError")
+"""
+
+
+def test_lazy_import():
+    """`import pytabular` defers submodule imports and CLR setup."""
+    subprocess.run([sys.executable, "-c", _LAZY_IMPORT_CHECK], check=True)
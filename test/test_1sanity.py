@@ -5,7 +5,11 @@ Or am I crazy person about to descend into madness.
 """
 
 import pytabular as p
-from Microsoft.AnalysisServices.Tabular import Database
+
+# CLR setup is deferred now, so configure it before the .NET import.
+p._ensure_clr()
+
+from Microsoft.AnalysisServices.Tabular import Database  # noqa: E402
 
 
 def test_sanity_check():